@@ -21,8 +21,8 @@ the following:
 
 Remarks:
 --------
-    (1) This script only requires the "os", "sys", and "subprocess"
-        packages, which are core Python.  Therefore, this script can
+    (1) This script only requires core Python packages (boto3 is
+        optional, see below).  Therefore, this script can
         be shipped with GEOS-Chem run directories.  It only requires
         Python 3 and not a full Anaconda/Miniconda environment (but
         you can run in an Anaconda environment if you have one).
@@ -31,16 +31,72 @@ Remarks:
         commands from a bash script than a Python script.  Therefore,
         in this routine we create a bash script with all of the
         download commands that will be executed by the main routine.
+
+    (3) The bash script downloads several files at once (16 by
+        default).  Use the -jobs=N argument to change this number.
+
+    (4) When downloading from AWS, the bash script will use s5cmd
+        (https://github.com/peak/s5cmd) instead of aws s3 sync if it
+        is installed.  s5cmd downloads all files from a single
+        process and is much faster when many files are missing.
+
+    (5) When downloading from ComputeCanada, the bash script will
+        download all files with a single curl command instead of
+        wget, if the installed curl can run parallel transfers.
+
+    (6) When neither s5cmd nor a parallel curl is available, the
+        bash script runs each download as a background job.  Limiting
+        the number of running jobs uses "wait -n" with bash 4.3 or
+        later.  Older bash versions (e.g. on CentOS 7) instead wait
+        for the oldest running job.
+
+    (7) If s5cmd is not installed but the boto3 package is, files
+        are downloaded from AWS by a pool of threads within this
+        Python process, and no bash script is created.
 """
 
 # Imports
 import os
 import sys
+import json
+import heapq
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# boto3 is optional.  If it is installed, files can be downloaded
+# from AWS without having to start an aws process for each file.
+try:
+    import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config
+except ImportError:
+    boto3 = None
 
 # Define global variables
 INPUT_GEOS_FILE = "./input.geos"
 DATA_DOWNLOAD_SCRIPT = "./auto_generated_download_script.sh"
+AWS_ROOT = "s3://gcgrid"
+DEFAULT_JOBS = 16
+MB = 1024 * 1024
+
+# Maximum length of a generated command line (the shell limit is larger)
+MAX_CMD_LEN = 100000
+
+# Large files (e.g. met fields) are downloaded in parts of PART_SIZE_MB,
+# with up to PART_JOBS ranged requests per file running at once
+PART_SIZE_MB = 16
+PART_JOBS = 8
+
+# GMI files that are really copies of another file
+# (key = name needed by GEOS-Chem, value = name of the remote file)
+GMI_FILE_ALIASES = {
+    "gmi.clim.IPMN.geos5.2x25.nc": "gmi.clim.PMN.geos5.2x25.nc",
+    "gmi.clim.NPMN.geos5.2x25.nc": "gmi.clim.PMN.geos5.2x25.nc",
+    "gmi.clim.RIPA.geos5.2x25.nc": "gmi.clim.RIP.geos5.2x25.nc",
+    "gmi.clim.RIPB.geos5.2x25.nc": "gmi.clim.RIP.geos5.2x25.nc",
+    "gmi.clim.RIPD.geos5.2x25.nc": "gmi.clim.RIP.geos5.2x25.nc",
+}
 
 
 def extract_pathnames_from_log(dryrun_log):
@@ -60,53 +116,72 @@ def extract_pathnames_from_log(dryrun_log):
             paths["missing"]: List of file paths that are missing.
             paths["local_prefix"]: Local data directory root.
 
+    Remarks:
+    --------
+        The paths are cached in the file dryrun_log + ".paths.json",
+        which is reused (instead of parsing the log file again) for
+        as long as the size and modification time of the log match.
+
     Author:
     -------
         Jiawei Zhuang (jiaweizhuang@g.harvard.edu)
         Modified by Bob Yantosca (yantosca@seas.harvard.edu)
     """
 
+    # Return the cached paths if the log file has not changed since
+    # the cache was written.  Otherwise, parse the log file again.
+    cache_file = dryrun_log + ".paths.json"
+    try:
+        stat = os.stat(dryrun_log)
+    except FileNotFoundError:
+        raise FileNotFoundError("Could not find file {}".format(dryrun_log))
+    log_id = [stat.st_size, stat.st_mtime_ns]
+    try:
+        with open(cache_file, "r") as f:
+            cache = json.load(f)
+        if cache["log_id"] == log_id:
+            return cache["paths"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
     # Initialization
     comments = ["!"*79,
                 "!!! LIST OF (UNIQUE) FILES REQUIRED FOR THE SIMULATION"]
     data_found = set()
     data_missing = set()
 
-    # Open file (or die with error)
+    # Read data from the file line by line (or die with error).
+    # Iterating over the file object streams it in buffered blocks,
+    # so that only the current line is held in memory.  File paths
+    # are normalized so that each file is only downloaded once.
     try:
-        f = open(dryrun_log, "r")
-    except FileNotFoundError:
-        raise FileNotFoundError("Could not find file {}".format(dryrun_log))
-
-    # Read data from the file line by line.
-    # Add file paths to the data_list set.
-    line = f.readline()
-    while line:
-
-        # Convert line to uppercase for string match
-        upcaseline = line.upper()
+        with open(dryrun_log, "r") as f:
+            for line in f:
 
-        # Search for data paths that have been found
-        if (": OPENING" in upcaseline) or (": READING" in upcaseline):
-            data_found.add(line.split()[-1])
+                # Convert line to uppercase for string match
+                upcaseline = line.upper()
 
-        # Search for data paths that are missing
-        elif "FILE NOT FOUND" in upcaseline:
-            data_missing.add(line.split()[-1])
+                # Search for data paths that have been found
+                if (": OPENING" in upcaseline) or \
+                   (": READING" in upcaseline):
+                    data_found.add(os.path.normpath(line.split()[-1]))
 
-        # Search for certain dry-run comment strings
-        # (and make sure to prevent duplicates)
-        elif ("!!! STA" in upcaseline) or ("!!! END" in upcaseline) or \
-             ("!!! SIM" in upcaseline) or ("!!! MET" in upcaseline) or \
-             ("!!! GRI" in upcaseline):
-            if line.rstrip() not in comments:
-                comments.append(line.rstrip())
+                # Search for data paths that are missing
+                elif "FILE NOT FOUND" in upcaseline:
+                    data_missing.add(os.path.normpath(line.split()[-1]))
 
-        else:
-            pass
+                # Search for certain dry-run comment strings
+                # (and make sure to prevent duplicates)
+                elif ("!!! STA" in upcaseline) or \
+                     ("!!! END" in upcaseline) or \
+                     ("!!! SIM" in upcaseline) or \
+                     ("!!! MET" in upcaseline) or \
+                     ("!!! GRI" in upcaseline):
+                    if line.rstrip() not in comments:
+                        comments.append(line.rstrip())
 
-        # Read next line
-        line = f.readline()
+    except FileNotFoundError:
+        raise FileNotFoundError("Could not find file {}".format(dryrun_log))
 
     # Add another line to the comment list
     comments.append("!"*79)
@@ -128,11 +203,18 @@ def extract_pathnames_from_log(dryrun_log):
         msg = "Could not locate the ExtData folder in your local disk space!"
         raise ValueError(msg)
 
-    # Close file and return
-    # The "sorted" command will return unique values
-    f.close()
-    return {"comments": comments, "found": found,
-            "missing": missing, "local_prefix": local_prefix}
+    paths = {"comments": comments, "found": found,
+             "missing": missing, "local_prefix": local_prefix}
+
+    # Cache the paths for the next call (skip if the folder
+    # containing the log file is not writable)
+    try:
+        with open(cache_file, "w", buffering=MB) as f:
+            json.dump({"log_id": log_id, "paths": paths}, f)
+    except OSError:
+        pass
+
+    return paths
 
 
 def get_run_info():
@@ -268,11 +350,12 @@ def write_unique_paths(paths, unique_log):
         unique_log : str
             Log file that will hold unique data paths.
     """
-    combined_paths = paths["found"] + paths["missing"]
-    combined_paths.sort()
+    # Both lists are already sorted, so merge them lazily
+    # instead of concatenating and sorting a new list
+    combined_paths = heapq.merge(paths["found"], paths["missing"])
 
     try:
-        with open(unique_log, "w") as f:
+        with open(unique_log, "w", buffering=MB) as f:
             for comment in paths["comments"]:
                 print(comment, file=f)
             for path in combined_paths:
@@ -285,7 +368,173 @@ def write_unique_paths(paths, unique_log):
         raise FileNotFoundError("Could not write {}".format(unique_log))
 
 
-def create_download_script(paths, from_aws=False):
+def get_download_tasks(paths):
+    """
+    Generates download tasks for the missing data files, one at
+    a time, so that the full list of tasks is never held in memory.
+
+    Args:
+    -----
+        paths : dict
+            Output of function extract_pathnames_from_log.
+
+    Yields:
+    -------
+        task : dict
+            task["remote"]: Path to the remote file, relative to ExtData.
+            task["local"]: Local path where the file will be stored.
+            task["link"]: Run directory path that will be linked to
+                the local file (for restart files), or "".
+    """
+    for path in paths["missing"]:
+
+        if "-->" in path:
+
+            # ----------------------------------------------------------
+            # Edge case: Linked restart files
+            # Copy the restart file to local ExtData, then create a
+            # symbolic link from the run directory to that file.
+            # ----------------------------------------------------------
+            link = (path.split("-->")[0]).strip()
+            local = (path.split("-->")[1]).strip()
+            index = local.find("ExtData") + 7
+            yield {"remote": local[index:],
+                   "local": local,
+                   "link": link}
+
+        elif "ExtData" in path:
+
+            # ----------------------------------------------------------
+            # All other files in ExtData.  Some GMI files are really
+            # copies of another file, which has to be renamed locally.
+            # ----------------------------------------------------------
+            index = path.find("ExtData") + 7
+            remote = path[index:]
+            for alias, real in GMI_FILE_ALIASES.items():
+                if alias in remote:
+                    remote = remote.replace(alias, real)
+                    break
+            yield {"remote": remote,
+                   "local": path,
+                   "link": ""}
+
+
+def get_link_cmds(task):
+    """
+    Returns the commands that link a downloaded restart file
+    to the run directory.
+
+    Args:
+    -----
+        task : dict
+            Task generated by get_download_tasks.
+
+    Returns:
+    --------
+        cmds : list of str
+            Commands to (re)create the link, or an empty list
+            if the task does not need a link.
+    """
+    if not task["link"]:
+        return []
+
+    # Remove the prior link for safety's sake, then create a
+    # symbolic link from the run directory to the local file
+    return ["if [[ -L " + task["link"] + " ]]; then " +
+            "unlink " + task["link"] + "; fi",
+            "ln -s " + task["local"] + " " + task["link"]]
+
+
+def get_wget_cmds(paths, cmd_prefix, remote_root):
+    """
+    Generates the commands to download each missing file from
+    the ComputeCanada data archive with wget.
+
+    Args:
+    -----
+        paths : dict
+            Output of function extract_pathnames_from_log.
+
+        cmd_prefix : str
+            The wget command and options, up to the URL.
+
+        remote_root : str
+            URL of the ExtData folder on the remote server.
+
+    Yields:
+    -------
+        cmds : list of str
+            Commands to download (and rename or link) one file.
+    """
+    for task in get_download_tasks(paths):
+        url = '"' + remote_root + task["remote"] + '"'
+
+        # wget -r keeps the remote file name.  If the local name differs,
+        # write straight to the local name instead, since several local
+        # files may be aliases of the same remote file and their jobs
+        # would otherwise write to (and move) the same file at once.
+        remote_name = os.path.basename(task["remote"])
+        if remote_name != os.path.basename(task["local"]):
+            cmds = ["mkdir -p " + os.path.dirname(task["local"]),
+                    'wget -O "' + task["local"] + '" ' + url]
+        else:
+            cmds = [cmd_prefix + url]
+
+        yield cmds + get_link_cmds(task)
+
+
+def get_aws_sync_cmds(paths):
+    """
+    Returns the commands to download the missing files from the
+    AWS s3://gcgrid bucket.  Files in the same folder are fetched
+    by a single "aws s3 sync" command, which starts aws only once
+    and skips files that are already present locally.
+
+    Args:
+    -----
+        paths : dict
+            Output of function extract_pathnames_from_log.
+
+    Returns:
+    --------
+        job_list : list of list of str
+            Commands for each job.  Restart file links are not
+            included, see function get_link_cmds.
+    """
+    job_list = []
+    folders = {}
+
+    for task in get_download_tasks(paths):
+        remote_dir, remote_name = os.path.split(task["remote"])
+        local_dir, local_name = os.path.split(task["local"])
+
+        # Files that are renamed locally are copied one by one
+        if remote_name != local_name:
+            job_list.append(["aws s3 cp --request-payer=requester " +
+                             AWS_ROOT + task["remote"] + " " +
+                             task["local"]])
+        else:
+            folders.setdefault((remote_dir, local_dir), []).append(
+                remote_name)
+
+    # Split the --include arguments of each folder into chunks,
+    # so that the command lines stay well below the shell limit
+    for (remote_dir, local_dir), names in folders.items():
+        cmd_prefix = "aws s3 sync --request-payer=requester " + \
+                     AWS_ROOT + remote_dir + " " + local_dir + \
+                     " --exclude '*'"
+        cmd = cmd_prefix
+        for name in names:
+            if len(cmd) > MAX_CMD_LEN:
+                job_list.append([cmd])
+                cmd = cmd_prefix
+            cmd += " --include '" + name + "'"
+        job_list.append([cmd])
+
+    return job_list
+
+
+def create_download_script(paths, from_aws=False, jobs=DEFAULT_JOBS):
     """
     Creates a data download script to obtain missing files
     from the ComputeCanada data archive (default), or the
@@ -299,184 +548,143 @@ def create_download_script(paths, from_aws=False):
         from_aws : bool
             If True, download from AWS s3://gcgrid.
             If False, download from ComputeCanada (default).
+
+        jobs : int
+            Maximum number of files that the script will
+            download simultaneously with aws s3 sync, wget, or curl.
+            Default value: DEFAULT_JOBS
+
+    Remarks:
+    --------
+        When downloading from AWS, the script will pass all
+        transfers to a single "s5cmd run" command if s5cmd is
+        installed.  This avoids starting a new aws process (and
+        loading its credentials) for every file.  Otherwise, the
+        script falls back to issuing aws s3 sync commands.
+
+        Similarly, when downloading from ComputeCanada, the script
+        will pass all transfers to a single curl command if curl
+        supports parallel transfers.  Otherwise, the script falls
+        back to issuing wget commands.
     """
 
     # Define variables to create data download commands
     # for either ComputeCanada or AWS
     if from_aws:
-        cmd_prefix = "aws s3 cp --request-payer=requester "
-        remote_root = "s3://gcgrid"
-        quote = ""
+        remote_root = AWS_ROOT
     else:
         cmd_prefix = 'wget -r -np -nH -R "*.html" -N -P ' + \
                      paths["local_prefix"] + " "
         remote_root = "http://geoschemdata.computecanada.ca/ExtData"
-        quote = '"'
 
-    # Create the data download script
-    with open(DATA_DOWNLOAD_SCRIPT, "w") as f:
+    # Create the data download script.  Use a large buffer so that
+    # the whole script is written with only a few system calls.
+    with open(DATA_DOWNLOAD_SCRIPT, "w", buffering=MB) as f:
 
         # Write shebang line to script
         print("#!/bin/bash\n", file=f)
         print("# This script was generated by download_data.py\n", file=f)
+        print("status=0\n", file=f)
+
+        # Download all files with a single s5cmd process, if available.
+        # Files already present locally with the same size are skipped.
+        # Restart file links are created after all downloads finish.
+        if from_aws:
+            print("if command -v s5cmd > /dev/null 2>&1; then\n", file=f)
+            print("s5cmd --request-payer requester run << 'EOF'", file=f)
+            for task in get_download_tasks(paths):
+                print("cp --if-size-differ --concurrency {} " \
+                      "--part-size {} {} {}".format(
+                          PART_JOBS, PART_SIZE_MB,
+                          remote_root + task["remote"], task["local"]),
+                      file=f)
+            print("EOF", file=f)
+            print("status=$?", file=f)
+            for task in get_download_tasks(paths):
+                for cmd in get_link_cmds(task):
+                    print(cmd, file=f)
+            print("\nelse\n", file=f)
+
+        # Likewise, download all files from ComputeCanada with a single
+        # curl process running parallel transfers (curl 7.68 or later,
+        # which added the --parallel-immediate option).  Like wget,
+        # follow redirects and retry transient failures.
+        else:
+            print("if curl --help all 2> /dev/null | " +
+                  "grep -q -- --parallel-immediate; then\n", file=f)
+            print("curl --parallel --parallel-immediate " +
+                  "--parallel-max {} ".format(max(int(jobs), 1)) +
+                  "--location --retry 3 --fail --create-dirs " +
+                  "--config - << 'EOF'", file=f)
+            for task in get_download_tasks(paths):
+                print('url = "{}"'.format(remote_root + task["remote"]),
+                      file=f)
+                print('output = "{}"'.format(task["local"]), file=f)
+            print("EOF", file=f)
+            print("status=$?", file=f)
+            for task in get_download_tasks(paths):
+                for cmd in get_link_cmds(task):
+                    print(cmd, file=f)
+            print("\nelse\n", file=f)
+
+        # Otherwise, each file is downloaded by a background job, so that
+        # the connection setup and request latency of one transfer overlap
+        # with the others.  Wait whenever max_jobs transfers are running.
+        # NOTE: wait -n requires bash 4.3 or later.  With older bash,
+        # wait for the oldest job instead, which is already recorded in
+        # status so that it is not waited on again at the end.
+        print("max_jobs={}".format(max(int(jobs), 1)), file=f)
+        print("pids=()", file=f)
+        print("waited=0", file=f)
+        print("if (( BASH_VERSINFO[0] > 4 || " +
+              "(BASH_VERSINFO[0] == 4 && BASH_VERSINFO[1] >= 3) )); then",
+              file=f)
+        print("    have_wait_n=1", file=f)
+        print("else", file=f)
+        print("    have_wait_n=0", file=f)
+        print("fi\n", file=f)
+        print("throttle() {", file=f)
+        print("    if (( have_wait_n )); then", file=f)
+        print("        while (( $(jobs -rp | wc -l) >= max_jobs )); do",
+              file=f)
+        print("            wait -n", file=f)
+        print("        done", file=f)
+        print("    else", file=f)
+        print("        while (( ${#pids[@]} - waited >= max_jobs )); do",
+              file=f)
+        print('            wait "${pids[$waited]}" || status=1', file=f)
+        print("            waited=$((waited + 1))", file=f)
+        print("        done", file=f)
+        print("    fi", file=f)
+        print("}\n", file=f)
 
         # Write download commands for only the missing data files
-        for path in paths["missing"]:
-
-            if "-->" in path:
-
-                # ------------------------------------------------------
-                # Edge case: Linked restart files
-                # ------------------------------------------------------
-
-                # First copy the restart file to local ExtData
-                remote_rst = (path.split("-->")[1]).strip()
-                local_rst = (path.split("-->")[0]).strip()
-                index1 = remote_rst.find("initial")
-                index2 = remote_rst.find("ExtData") + 7
-                prefix = remote_rst[0:index1]
-                remote_rst = remote_root + remote_rst[index2:]
-                cmd = cmd_prefix + quote + remote_rst + quote
-                if from_aws:
-                    cmd += " " + prefix
-                print(cmd, file=f)
-                print(file=f)
-
-                # Remove the prior link for safety's sake
-                cmd = "if [[ -L " + local_rst + " ]]; then unlink " + \
-                      local_rst + "; fi"
-                print(cmd, file=f)
-
-                # Then create a symbolic link from the run directory
-                # to the restart file in the local ExtData
-                index3 = remote_rst.find("initial")
-                cmd = "ln -s " + prefix + remote_rst[index3:] + \
-                      " " + local_rst
-                print(cmd, file=f)
-                print(file=f)
-
-            elif "gmi.clim.IPMN.geos5.2x25.nc" in path:
-
-                # ------------------------------------------------------
-                # Edge case: GMI IPMN file is really the PMN file
-                # ------------------------------------------------------
-
-                # Download the PMN file
-                index = path.find("ExtData") + 7
-                local_dir = os.path.dirname(path)
-                remote_path = remote_root + path[index:]
-                remote_path = remote_path.replace("IPMN", "PMN")
-                cmd = cmd_prefix + quote + remote_path + quote
-                if from_aws:
-                    cmd += " " + local_dir + "/"
-                print(cmd, file=f)
-
-                # Rename it to IPMN
-                cmd = "mv " + local_dir + "/gmi.clim.PMN.geos5.2x25.nc " + \
-                      local_dir + "/gmi.clim.IPMN.geos5.2x25.nc"
-                print(cmd, file=f)
-
-            elif "gmi.clim.NPMN.geos5.2x25.nc" in path:
-
-                # ------------------------------------------------------
-                # Edge case: GMI NPMN file is really the PMN file
-                # ------------------------------------------------------
-
-                # Download the PMN file
-                index = path.find("ExtData") + 7
-                local_dir = os.path.dirname(path)
-                remote_path = remote_root + path[index:]
-                remote_path = remote_path.replace("NPMN", "PMN")
-                cmd = cmd_prefix + quote + remote_path + quote
-                if from_aws:
-                    cmd += " " + local_dir + "/"
-                print(cmd, file=f)
-
-                # Rename it to NPMN
-                cmd = "mv " + local_dir + "/gmi.clim.PMN.geos5.2x25.nc " + \
-                      local_dir + "/gmi.clim.NPMN.geos5.2x25.nc"
-                print(cmd, file=f)
-                print(file=f)
-
-            elif "gmi.clim.RIPA.geos5.2x25.nc" in path:
-
-                # ------------------------------------------------------
-                # Edge case: GMI RIPA file is really the RIP file
-                # ------------------------------------------------------
-
-                # Download the RIP file
-                index = path.find("ExtData")+7
-                local_dir = os.path.dirname(path)
-                remote_path = remote_root + path[index:]
-                remote_path = remote_path.replace("RIPA", "RIP")
-                cmd = cmd_prefix + quote + remote_path + quote
-                if from_aws:
-                    cmd += " " + local_dir + "/"
-                print(cmd, file=f)
-
-                # Rename it to NPMN
-                cmd = "mv " + local_dir + "/gmi.clim.RIP.geos5.2x25.nc " + \
-                      local_dir + "/gmi.clim.RIPA.geos5.2x25.nc"
-                print(cmd, file=f)
-                print(file=f)
-
-            elif "gmi.clim.RIPB.geos5.2x25.nc" in path:
-
-                # ------------------------------------------------------
-                # Edge case: GMI RIPB file is really the RIP file
-                # ------------------------------------------------------
-
-                # Download the RIP file
-                index = path.find("ExtData")+7
-                local_dir = os.path.dirname(path)
-                remote_path = remote_root + path[index:]
-                remote_path = remote_path.replace("RIPB", "RIP")
-                cmd = cmd_prefix + quote + remote_path + quote
-                if from_aws:
-                    cmd += " " + local_dir + "/"
-                print(cmd, file=f)
-
-                # Rename it to RIPB
-                cmd = "mv " + local_dir + "/gmi.clim.RIP.geos5.2x25.nc " + \
-                      local_dir + "/gmi.clim.RIPB.geos5.2x25.nc"
-                print(cmd, file=f)
-                print(file=f)
-
-            elif "gmi.clim.RIPD.geos5.2x25.nc" in path:
-
-                # ------------------------------------------------------
-                # Edge case: GMI RIPD file is really the RIP file
-                # ------------------------------------------------------
-
-                # Download the RIP file
-                index = path.find("ExtData")+7
-                local_dir = os.path.dirname(path)
-                remote_path = remote_root + path[index:]
-                remote_path = remote_path.replace("RIPD", "RIP")
-                cmd = cmd_prefix + quote + remote_path + quote
-                if from_aws:
-                    cmd += " " + local_dir + "/"
-                print(cmd, file=f)
-
-                # Rename it to RIPD
-                cmd = "mv " + local_dir + "/gmi.clim.RIP.geos5.2x25.nc " + \
-                      local_dir + "/gmi.clim.RIPD.geos5.2x25.nc"
-                print(cmd, file=f)
-                print(file=f)
-
-            elif "ExtData" in path:
-
-                # ------------------------------------------------------
-                # All other files in ExtData
-                # ------------------------------------------------------
-                index = path.find("ExtData") + 7
-                local_dir = os.path.dirname(path)
-                remote_path = remote_root + path[index:]
-                cmd = cmd_prefix + quote + remote_path + quote
-                if from_aws:
-                    cmd += " " + local_dir + "/"
-                print(cmd, file=f)
-                print(file=f)
+        if from_aws:
+            job_list = get_aws_sync_cmds(paths)
+        else:
+            job_list = get_wget_cmds(paths, cmd_prefix, remote_root)
+        for cmds in job_list:
+
+            # Run the commands for these files as a background job
+            print("{", file=f)
+            for cmd in cmds:
+                print("    " + cmd + " || exit 1", file=f)
+            print("} &", file=f)
+            print("pids+=($!)", file=f)
+            print("throttle\n", file=f)
+
+        # Wait for all downloads and keep track of any failures
+        print('for pid in "${pids[@]:$waited}"; do', file=f)
+        print('    wait "$pid" || status=1', file=f)
+        print("done\n", file=f)
+
+        # aws s3 sync downloads whole groups of files, so restart
+        # file links can only be created once all jobs are done
+        if from_aws:
+            for task in get_download_tasks(paths):
+                for cmd in get_link_cmds(task):
+                    print(cmd, file=f)
+        print("\nfi\n", file=f)
 
         # Kludge: Create a ExtData/CHEM_INPUTS folder if it
         # does not exist. This will prevent abnormal exits.
@@ -485,12 +693,85 @@ def create_download_script(paths, from_aws=False):
             chem_inputs_dir, chem_inputs_dir)
         print(cmd, file=f)
         print(file=f)
+        print("exit $status", file=f)
 
         # Close file and make it executable
         f.close()
         os.chmod(DATA_DOWNLOAD_SCRIPT, 0o755)
 
 
+def download_from_aws_in_process(paths, jobs=DEFAULT_JOBS):
+    """
+    Downloads missing files from the AWS s3://gcgrid bucket with
+    boto3, using a pool of threads that share a single S3 client.
+
+    Args:
+    -----
+        paths : dict
+            Output of function extract_pathnames_from_log.
+
+        jobs : int
+            Maximum number of files to download simultaneously.
+            Default value: DEFAULT_JOBS
+
+    Returns:
+    --------
+        status : int
+            0 if all files were downloaded, or 1 otherwise.
+    """
+    jobs = max(int(jobs), 1)
+
+    # Each file can have up to PART_JOBS requests in flight, so size
+    # the connection pool to match (botocore only keeps 10 by default)
+    client = boto3.client("s3", config=Config(
+        max_pool_connections=jobs * PART_JOBS))
+    config = TransferConfig(multipart_threshold=8*MB,
+                            multipart_chunksize=PART_SIZE_MB*MB,
+                            max_concurrency=PART_JOBS,
+                            io_chunksize=MB,
+                            max_io_queue=10000)
+
+    def download(task):
+        key = task["remote"].lstrip("/")
+
+        # Skip files that were already downloaded (e.g. by a prior run
+        # that was interrupted), i.e. that match the size on S3
+        if not os.path.isfile(task["local"]) or \
+           os.path.getsize(task["local"]) != client.head_object(
+               Bucket="gcgrid", Key=key,
+               RequestPayer="requester")["ContentLength"]:
+            os.makedirs(os.path.dirname(task["local"]), exist_ok=True)
+            client.download_file("gcgrid", key, task["local"],
+                                 ExtraArgs={"RequestPayer": "requester"},
+                                 Config=config)
+
+        # Remove the prior link for safety's sake, then create a
+        # symbolic link from the run directory to the local file
+        if task["link"]:
+            if os.path.islink(task["link"]):
+                os.unlink(task["link"])
+            os.symlink(task["local"], task["link"])
+
+    # Download the files and keep track of any failures
+    status = 0
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(download, task): task
+                   for task in get_download_tasks(paths)}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as err:
+                print("Error downloading {}: {}".format(
+                    futures[future]["remote"], err))
+                status = 1
+
+    # Kludge: Create a ExtData/CHEM_INPUTS folder if it
+    # does not exist. This will prevent abnormal exits.
+    os.makedirs(paths["local_prefix"] + "ExtData/CHEM_INPUTS", exist_ok=True)
+
+    return status
+
+
 def download_the_data(args):
     """
     Downloads GEOS-Chem data files from the ComputeCanada server
@@ -524,13 +805,21 @@ def download_the_data(args):
     else:
         print("Downloading data from ComputeCanada")
 
-    # Create script to download missing files from AWS S3
-    create_download_script(paths, args["from_aws"])
+    # Download directly from AWS S3 with boto3 if possible
+    # (but prefer the s5cmd script if s5cmd is installed)
+    if args["from_aws"] and boto3 is not None and \
+       shutil.which("s5cmd") is None:
+        status = download_from_aws_in_process(paths, args["jobs"])
+
+    else:
+
+        # Create script to download missing files
+        create_download_script(paths, args["from_aws"], args["jobs"])
 
-    # Run the data download script and return the status
-    # Remove the file afterwards
-    status = subprocess.call(DATA_DOWNLOAD_SCRIPT)
-    os.remove(DATA_DOWNLOAD_SCRIPT)
+        # Run the data download script and return the status
+        # Remove the file afterwards
+        status = subprocess.call(DATA_DOWNLOAD_SCRIPT)
+        os.remove(DATA_DOWNLOAD_SCRIPT)
 
     # Raise an exception if the data was not successfully downloaded
     if status != 0:
@@ -557,13 +846,17 @@ def parse_args():
             args["from_aws"]: Download from AWS S3? (True/False)
             args["skip-download"]: Skip downloading and only write
                out the log with unique file names.
+            args["jobs"]: Number of simultaneous downloads.
     """
     dryrun_log = ""
     from_aws = False
     skip_download = False
+    jobs = DEFAULT_JOBS
 
     for i in range(1, len(sys.argv)):
-        if "AWS" in sys.argv[i].upper():
+        if sys.argv[i].upper().startswith("-JOBS="):
+            jobs = int(sys.argv[i].split("=")[1])
+        elif "AWS" in sys.argv[i].upper():
             from_aws = True
         elif "CC" in sys.argv[i].upper():
             from_aws = False
@@ -577,7 +870,8 @@ def parse_args():
 
     return {"dryrun_log": dryrun_log,
             "from_aws": from_aws,
-            "skip_download" : skip_download}
+            "skip_download" : skip_download,
+            "jobs": jobs}
 
 
 def main():
@@ -590,6 +884,7 @@ def main():
         ./download_data.py log -aws            # from AWS
         ./download_data.py log -cc             # from ComputeCanada
         ./download_data.py log -skip-download  # Print unique log & exit
+        ./download_data.py log -aws -jobs=32   # 32 downloads at once
     """
     download_the_data(parse_args())
 
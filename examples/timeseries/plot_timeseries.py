@@ -119,7 +119,7 @@ def find_value_index(seq, val):
     return int(result[0])
 
 
-def read_geoschem_data(path, collections):
+def read_geoschem_data(path, collections, chunks=None, engine=None):
     '''
     Returns an xarray Dataset containing timeseries data.
 
@@ -139,13 +139,25 @@ def read_geoschem_data(path, collections):
             A Dataset object containing the GEOS-Chem diagnostic
             output corresponding to the collections that were
             specified.
+
+    Keyword Args (optional):
+    ------------------------
+        chunks : int, dict, or str
+            Dask chunk sizes, passed to xarray.open_mfdataset.
+            Use e.g. {'time': 1} to read one time at a time.
+            Default value: None (one chunk per file)
+
+        engine : str
+            Engine used to read the files (e.g. 'netcdf4' or
+            'h5netcdf'), passed to xarray.open_mfdataset.
+            Default value: None (let xarray pick the engine)
     '''
 
     # Get a list of variables that GCPy should not read.
     # These are mostly variables introduced into GCHP with the MAPL v1.0.0
     # update.  These variables contain either repeated or non-standard
     # dimensions that can cause problems in xarray when combining datasets.
-    skip_vars = gcon.skip_these_vars()
+    skip_vars = gcon.skip_these_vars
     
     # Find all files in the given 
     file_list = find_files_in_dir(path, collections) 
@@ -156,10 +168,12 @@ def read_geoschem_data(path, collections):
     if int(v[0]) == 0 and int(v[1]) >= 15: 
         return xr.open_mfdataset(file_list,
                                  drop_variables=skip_vars,
-                                 combine="nested")
+                                 combine="nested", parallel=True,
+                                 chunks=chunks, engine=engine)
     else:
         return xr.open_mfdataset(file_list,
-                                 drop_variables=skip_vars)
+                                 drop_variables=skip_vars, parallel=True,
+                                 chunks=chunks, engine=engine)
 
 
 def plot_timeseries_data(ds, site_coords):
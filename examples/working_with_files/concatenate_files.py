@@ -130,7 +130,7 @@ def main():
     # These are mostly variables introduced into GCHP with the MAPL v1.0.0
     # update.  These variables contain either repeated or non-standard
     # dimensions that can cause problems in xarray when combining datasets.
-    skip_vars = gcon.skip_these_vars()
+    skip_vars = gcon.skip_these_vars
     
     # Look for all the netCDF files in the path
     file_list = find_files_in_dir(path_to_dir, substrs)
@@ -141,10 +141,10 @@ def main():
     if int(v[0]) == 0 and int(v[1]) >= 15: 
         return xr.open_mfdataset(file_list,
                                  drop_variables=skip_vars,
-                                 combine="nested")
+                                 combine="nested", parallel=True)
     else:
         return xr.open_mfdataset(file_list,
-                                 drop_variables=skip_vars)
+                                 drop_variables=skip_vars, parallel=True)
 
     # Replace NaN values with zeroes
     ds = replace_nans_with_zeroes(ds, verbose=True)
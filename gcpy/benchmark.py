@@ -914,7 +914,7 @@ def make_benchmark_conc_plots(
     if not plot_by_spc_cat:
         [refds, devds] = util.add_missing_variables(refds, devds)
         var_prefix = 'SpeciesConc_'
-        varlist = [k for k in refds.data_vars.keys() if var_prefix in k]
+        varlist = [k for k in refds.data_vars if var_prefix in k]
         varlist.sort()
 
         # Surface
@@ -1770,12 +1770,14 @@ def make_benchmark_emis_tables(
     # Read the Ref dataset
     if len(reflist) == 1:
         reflist = [reflist]
-    refds = xr.open_mfdataset(reflist, drop_variables=gcon.skip_these_vars)
+    refds = xr.open_mfdataset(reflist, drop_variables=gcon.skip_these_vars,
+                              parallel=True, engine="netcdf4")
 
     # Read the Dev dataset
     if len(devlist) == 1:
         devlist = [devlist]
-    devds = xr.open_mfdataset(devlist, drop_variables=gcon.skip_these_vars)
+    devds = xr.open_mfdataset(devlist, drop_variables=gcon.skip_these_vars,
+                              parallel=True, engine="netcdf4")
 
     # Read the meteorology datasets if passed. These are optional since it
     # the refds and devds have variable AREA already (always true) and
@@ -3470,9 +3472,12 @@ def make_benchmark_aerosol_tables(
     }
     
     # Read data collections
-    ds_aer = xr.open_mfdataset(devlist_aero, data_vars=aod_list)
-    ds_spc = xr.open_mfdataset(devlist_spc, drop_variables=gcon.skip_these_vars)
-    ds_met = xr.open_mfdataset(devlist_met, drop_variables=gcon.skip_these_vars)
+    ds_aer = xr.open_mfdataset(devlist_aero, data_vars=aod_list, parallel=True,
+                               engine="netcdf4")
+    ds_spc = xr.open_mfdataset(devlist_spc, drop_variables=gcon.skip_these_vars,
+                               parallel=True, engine="netcdf4")
+    ds_met = xr.open_mfdataset(devlist_met, drop_variables=gcon.skip_these_vars,
+                               parallel=True, engine="netcdf4")
 
     # Get troposphere mask
     tropmask = get_troposphere_mask(ds_met)
@@ -3782,8 +3787,10 @@ def make_benchmark_operations_budget(
     print('Opening ref and dev data')
     skip_vars = gcon.skip_these_vars
     if annual:
-        ref_ds = xr.open_mfdataset(reffiles, drop_variables=skip_vars)
-        dev_ds = xr.open_mfdataset(devfiles, drop_variables=skip_vars)
+        ref_ds = xr.open_mfdataset(reffiles, drop_variables=skip_vars,
+                                   parallel=True, engine="netcdf4")
+        dev_ds = xr.open_mfdataset(devfiles, drop_variables=skip_vars,
+                                   parallel=True, engine="netcdf4")
     else:
         ref_ds = xr.open_dataset(reffiles, drop_variables=skip_vars)
         dev_ds = xr.open_dataset(devfiles, drop_variables=skip_vars)
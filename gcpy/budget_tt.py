@@ -129,8 +129,10 @@ class _GlobVars:
 
         # Restarts
         skip_vars = constants.skip_these_vars
-        self.ds_ini = xr.open_mfdataset(RstInit, drop_variables=skip_vars)
-        self.ds_end = xr.open_mfdataset(RstFinal, drop_variables=skip_vars)
+        self.ds_ini = xr.open_mfdataset(RstInit, drop_variables=skip_vars,
+                                        parallel=True, engine="netcdf4")
+        self.ds_end = xr.open_mfdataset(RstFinal, drop_variables=skip_vars,
+                                        parallel=True, engine="netcdf4")
 
         # Change the restart datasets into format similar to GCC, and flip vertical axis
         if is_gchp:
@@ -138,16 +140,22 @@ class _GlobVars:
             self.ds_end = rename_and_flip_gchp_rst_vars(self.ds_end)
         
         # Diagnostics
-        self.ds_dcy = xr.open_mfdataset(RadioNucl, drop_variables=skip_vars)
-        self.ds_dry = xr.open_mfdataset(DryDep, drop_variables=skip_vars)
-        self.ds_cnc = xr.open_mfdataset(SpeciesConc, drop_variables=skip_vars)
-        self.ds_wcv = xr.open_mfdataset(WetLossConv, drop_variables=skip_vars)
-        self.ds_wls = xr.open_mfdataset(WetLossLS, drop_variables=skip_vars)
+        self.ds_dcy = xr.open_mfdataset(RadioNucl, drop_variables=skip_vars,
+                                        parallel=True, engine="netcdf4")
+        self.ds_dry = xr.open_mfdataset(DryDep, drop_variables=skip_vars,
+                                        parallel=True, engine="netcdf4")
+        self.ds_cnc = xr.open_mfdataset(SpeciesConc, drop_variables=skip_vars,
+                                        parallel=True, engine="netcdf4")
+        self.ds_wcv = xr.open_mfdataset(WetLossConv, drop_variables=skip_vars,
+                                        parallel=True, engine="netcdf4")
+        self.ds_wls = xr.open_mfdataset(WetLossLS, drop_variables=skip_vars,
+                                        parallel=True, engine="netcdf4")
 
         # Met fields
         if is_gchp:
             self.ds_met = xr.open_mfdataset(StateMetAvg,
-                                            drop_variables=skip_vars)
+                                            drop_variables=skip_vars,
+                                            parallel=True, engine="netcdf4")
             # For now, don't read restarts for GCHP (bmy, 3/16/20)
             #ds_met_inst = xr.open_mfdataset(StateMetInst,
             #                                drop_variables=skip_vars)
@@ -156,13 +164,16 @@ class _GlobVars:
             #self.ds_ini = xr.merge([self.ds_ini, ds_met_inst.isel(time=0)])
             #self.ds_end = xr.merge([self.ds_end, ds_met_inst.isel(time=11)])
         else:
-            self.ds_met = xr.open_mfdataset(StateMet, drop_variables=skip_vars)
+            self.ds_met = xr.open_mfdataset(StateMet, drop_variables=skip_vars,
+                                            parallel=True, engine="netcdf4")
 
         # Emissions
         if self.is_gchp:
-            self.ds_hco = xr.open_mfdataset(GCHPEmiss, drop_variables=skip_vars)
+            self.ds_hco = xr.open_mfdataset(GCHPEmiss, drop_variables=skip_vars,
+                                            parallel=True, engine="netcdf4")
         else:
-            self.ds_hco = xr.open_mfdataset(HemcoDiag, drop_variables=skip_vars)
+            self.ds_hco = xr.open_mfdataset(HemcoDiag, drop_variables=skip_vars,
+                                            parallel=True, engine="netcdf4")
         
         # Area and troposphere mask
         # For gchp, get area in m2 from restart for use in calculating initial
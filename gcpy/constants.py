@@ -3,6 +3,8 @@ Contains definitions of physical and chemical constants,
 as well as other needed global variables.
 """
 
+from types import SimpleNamespace
+
 #: Acceleration due to gravity [m s-2]
 G = 9.80665
 
@@ -22,10 +24,40 @@ MW_AIR_g = 28.9644
 # Molar mass of water [kg mol-1]
 MW_H2O = 18.016e-3
 
-# netCDF variables that we should skip reading
-skip_these_vars = ["anchor", 
-                   "ncontact", 
-                   "orientation", 
-                   "contacts", 
-                   "cubed_sphere"]
+#: Universal gas constant [J K-1 mol-1]
+R_GAS = 8.314462618
+
+# Derived constants, precomputed here so that array expressions
+# can multiply by a single factor instead of dividing per element
+
+#: Specific gas constant of dry air [J K-1 kg-1]
+R_SPECIFIC_AIR = R_GAS / MW_AIR
 
+#: Number of molecules per kg of dry air [molec kg-1]
+MOLECULES_PER_KG_AIR = AVOGADRO / MW_AIR
+
+#: Ratio of the molar masses of water and dry air [1]
+MW_RATIO_H2O_AIR = MW_H2O / MW_AIR
+
+#: All of the physical constants above, gathered in a single namespace
+#: (e.g. "from gcpy.constants import CONST", then use CONST.G)
+CONST = SimpleNamespace(
+    G=G,
+    R_EARTH=R_EARTH,
+    AVOGADRO=AVOGADRO,
+    MW_AIR=MW_AIR,
+    MW_AIR_G=MW_AIR_g,
+    MW_H2O=MW_H2O,
+    R_GAS=R_GAS,
+    R_SPECIFIC_AIR=R_SPECIFIC_AIR,
+    MOLECULES_PER_KG_AIR=MOLECULES_PER_KG_AIR,
+    MW_RATIO_H2O_AIR=MW_RATIO_H2O_AIR,
+)
+
+# netCDF variables that we should skip reading
+# (frozenset, since this is only used for membership tests)
+skip_these_vars = frozenset(("anchor",
+                             "ncontact",
+                             "orientation",
+                             "contacts",
+                             "cubed_sphere"))
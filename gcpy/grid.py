@@ -1,6 +1,7 @@
 import numpy as np
 import xarray as xr
 from numpy import asarray
+from functools import lru_cache
 import scipy.sparse
 from itertools import product
 from .util import get_shape_of_data
@@ -498,6 +499,40 @@ INV_SQRT_3 = 1.0 / np.sqrt(3.0)
 ASIN_INV_SQRT_3 = np.arcsin(INV_SQRT_3)
 
 def make_grid_LL(llres, in_extent=[-180,180,-90,90], out_extent=[]):
+    """
+    Creates a lat/lon grid description.
+
+    Args:
+    -----
+        llres : str
+            Lat/lon resolution of the grid (e.g. "4x5").
+
+    Keyword Args (optional):
+    ------------------------
+        in_extent : list of float
+            Extent of the initial grid [minlon, maxlon, minlat, maxlat].
+            Default value: [-180, 180, -90, 90]
+        out_extent : list of float
+            Extent to which the grid is trimmed.
+            Default value: [] (use in_extent)
+
+    Returns:
+    --------
+        llgrid : dict
+            Contains the grid centers and edges under the keys
+            'lat', 'lon', 'lat_b', and 'lon_b'.
+
+    Remarks:
+    --------
+        Grids are cached, so the arrays in llgrid are shared between
+        calls with the same arguments and are read-only.  Keys of
+        llgrid may be reassigned, since a new dict is returned.
+    """
+    return dict(_make_grid_LL(llres, tuple(in_extent), tuple(out_extent)))
+
+
+@lru_cache(maxsize=None)
+def _make_grid_LL(llres, in_extent, out_extent):
     #get initial bounds of grid
     [minlon, maxlon, minlat, maxlat] = in_extent
     [dlat,dlon] = list(map(float, llres.split('x')))
@@ -512,7 +547,7 @@ def make_grid_LL(llres, in_extent=[-180,180,-90,90], out_extent=[]):
     lon = (lon_b[1:] + lon_b[:-1]) / 2
 
     #trim grid bounds when your desired extent is not the same as your initial grid extent
-    if out_extent == []:
+    if len(out_extent) == 0:
         out_extent = in_extent
     if out_extent != in_extent:
         [minlon, maxlon, minlat, maxlat] = out_extent
@@ -538,6 +573,10 @@ def make_grid_LL(llres, in_extent=[-180,180,-90,90], out_extent=[]):
               'lon': lon, 
               'lat_b': lat_b, 
               'lon_b': lon_b}
+
+    # Protect the cached arrays from being modified by callers
+    for arr in llgrid.values():
+        arr.flags.writeable = False
     return llgrid
 
 def make_grid_CS(csres,out_extent=[0,360,-90,90]):
@@ -87,7 +87,8 @@ class _GlobVars:
 
         # Vertical flux diagnostics
         skip_vars = gcon.skip_these_vars
-        self.ds_flx = xr.open_mfdataset(files, drop_variables=skip_vars)
+        self.ds_flx = xr.open_mfdataset(files, drop_variables=skip_vars,
+                                        parallel=True, engine="netcdf4")
 
         # Set a flag to denote if this data is from GCHP
         self.is_gchp = "nf" in self.ds_flx.dims.keys()
@@ -58,3 +58,122 @@ def test_maybe_as_array():
     arr5 = xr.DataArray(arr2)
     res5 = maybe_as_array(arr5)
     assert isinstance(res5, xr.DataArray)
+
+
+def test_extract_pathnames_from_log(tmp_path):
+    log = tmp_path / "GC.log"
+    log.write_text(
+        "HEMCO: Opening /home/ubuntu/ExtData/HEMCO/CO.nc\n"
+        "HEMCO: opening /home/ubuntu/ExtData/HEMCO/CO.nc\n"
+        "HEMCO: Opening /home/ubuntu/ExtData//HEMCO/./CO.nc\n"
+        " - GET_MET: Reading /home/ubuntu/ExtData/GEOS_4x5/A1.nc4\n"
+        "HEMCO: REQUIRED FILE NOT FOUND /home/ubuntu/ExtData/HEMCO/NO.nc\n"
+        "Some other line\n"
+    )
+
+    # All files that were opened or read, without duplicates
+    assert extract_pathnames_from_log(str(log)) == [
+        "/home/ubuntu/ExtData/GEOS_4x5/A1.nc4",
+        "/home/ubuntu/ExtData/HEMCO/CO.nc",
+    ]
+
+    # Only files under the prefix, with the prefix removed
+    assert extract_pathnames_from_log(
+        str(log), prefix_filter="/home/ubuntu/ExtData/HEMCO/") == ["CO.nc"]
+
+
+def test_extract_pathnames_from_several_logs(tmp_path):
+    logs = []
+    for i, name in enumerate(["CO.nc", "NO.nc", "CO.nc"]):
+        log = tmp_path / "GC{}.log".format(i)
+        log.write_text("HEMCO: Opening /home/ubuntu/ExtData/HEMCO/" + name)
+        logs.append(str(log))
+
+    # Paths from all log files, without duplicates
+    assert extract_pathnames_from_log(logs) == [
+        "/home/ubuntu/ExtData/HEMCO/CO.nc",
+        "/home/ubuntu/ExtData/HEMCO/NO.nc",
+    ]
+    assert extract_pathnames_from_log([]) == []
+
+
+def test_get_global_stats():
+    data = np.arange(24, dtype=np.float64).reshape(2, 3, 4)
+    stats = get_global_stats(xr.DataArray(data, dims=["time", "lat", "lon"]))
+    np.testing.assert_allclose(stats["mean"], data.mean())
+    assert stats["min"] == data.min()
+    assert stats["max"] == data.max()
+    assert stats["sum"] == data.sum()
+
+
+def test_add_lumped_species_to_dataset():
+    ds = xr.Dataset({"SpeciesConc_A": ("x", [1.0, 2.0]),
+                     "SpeciesConc_B": ("x", [10.0, 20.0])})
+    ds_new = add_lumped_species_to_dataset(
+        ds, lspc_dict={"L": {"A": 1, "B": 2}}, verbose=False)
+    np.testing.assert_array_equal(ds_new["SpeciesConc_L"], [21.0, 42.0])
+
+    # The constituent species must not be modified
+    np.testing.assert_array_equal(ds["SpeciesConc_A"], [1.0, 2.0])
+    np.testing.assert_array_equal(ds_new["SpeciesConc_A"], [1.0, 2.0])
+
+    # Existing species are only replaced if overwrite=True
+    ds_new = add_lumped_species_to_dataset(
+        ds_new, lspc_dict={"L": {"A": 1}}, verbose=False, overwrite=True)
+    np.testing.assert_array_equal(ds_new["SpeciesConc_L"], [1.0, 2.0])
+    assert "SpeciesConc_L" not in ds
+
+
+def test_get_dir_listing(tmp_path):
+    (tmp_path / "a.nc4").write_text("")
+    assert get_dir_listing(str(tmp_path)) == {"a.nc4"}
+
+    # New files are only seen after a refresh
+    (tmp_path / "b.nc4").write_text("")
+    assert get_dir_listing(str(tmp_path)) == {"a.nc4"}
+    assert get_dir_listing(str(tmp_path), refresh=True) == {"a.nc4", "b.nc4"}
+    assert get_dir_listing(str(tmp_path / "missing")) == set()
+
+
+def test_convert_bpch_names_to_netcdf_names():
+    names = ["IJ_AVG_S_O3", "IJ_AVG_S__CO", "CHEM_L_S_OH", "DAO_3D_S_UWND",
+             "NOT_A_BPCH_NAME"]
+    ds = xr.Dataset({name: ("x", [0.0]) for name in names})
+    ds_new = convert_bpch_names_to_netcdf_names(ds)
+    assert list(ds_new.data_vars) == ["SpeciesConc_O3", "SpeciesConc_CO",
+                                      "OHconcAfterChem", "Met_U",
+                                      "NOT_A_BPCH_NAME"]
+
+
+def test_prefetch_for_compare():
+    ds = xr.Dataset({"A": ("x", [1.0, 2.0]), "B": ("x", [3.0, 4.0])})
+    ds_subset = prefetch_for_compare(ds.chunk({"x": 1}), ["A"])
+    assert list(ds_subset.data_vars) == ["A"]
+    np.testing.assert_array_equal(ds_subset["A"], [1.0, 2.0])
+
+
+def test_compare_stats_all():
+    ref = xr.Dataset({"A": ("x", [1.0, 2.0]), "B": ("y", [3.0, np.nan])})
+    dev = xr.Dataset({"A": ("x", [2.0, 4.0]), "B": ("y", [3.0, 5.0])})
+    stats = compare_stats_all(ref.chunk(), "Ref", dev, "Dev", ["A", "B"])
+    assert stats["A"]["ref"]["sum"] == 3.0
+    assert stats["A"]["dev"]["mean"] == 3.0
+    assert np.isnan(stats["B"]["ref"]["max"])
+    assert stats["B"]["dev"]["min"] == 3.0
+
+
+def test_compare_varnames():
+    ref = xr.Dataset({"A": (("lat", "lon"), [[1.0]]),
+                      "B": (("lev", "lat", "lon"), [[[1.0]]]),
+                      "C": ("lev", [1.0]),
+                      "D": (("lat", "lon"), [[1.0]]),
+                      "E": ("lev", [1.0])})
+    dev = ref.drop_vars(["D", "E"])
+    vardict = compare_varnames(ref, dev, quiet=True)
+    assert vardict["commonvars2D"] == ["A"]
+    assert vardict["commonvars3D"] == ["B"]
+    assert vardict["commonvarsOther"] == ["C"]
+
+    # Only variables with lat and lon dimensions are kept
+    assert vardict["refonly"] == ["D"]
+    assert vardict["devonly"] == []
@@ -241,18 +241,20 @@ def convert_units(
 
     # Mass of dry air in kg (required when converting from v/v)
     if 'molmol-1' in units:
-        air_mass = delta_p * 100.0 / g0 * area_m2
+        # (scalar factors are grouped so they are only computed once)
+        air_mass = delta_p * (100.0 / g0) * area_m2
 
         # Conversion factor for v/v to kg
         # v/v * kg dry air / g/mol dry air * g/mol species = kg species
         if "g" in target_units:
-            vv_to_kg = air_mass / mw_air * mw_g
+            vv_to_kg = air_mass * (mw_g / mw_air)
 
         # Conversion factor for v/v to molec/cm3
         # v/v * kg dry air * mol/g dry air * molec/mol dry air /
         #  (area_m2 * box_height ) * 1m3/10^6cm3 = molec/cm3
         if "molec" in target_units:
-            vv_to_MND = air_mass / mw_air * Avo / (area_m2 * box_height) / 1e6
+            vv_to_MND = air_mass * (Avo / mw_air / 1e6) \
+                        / (area_m2 * box_height)
 
     # ================================================
     # Get number of seconds per time in dataset
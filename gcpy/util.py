@@ -3,13 +3,28 @@ objects used throughout GCPy """
 
 
 import os
+import re
+import mmap
 import yaml
 import shutil
 import numpy as np
 import xarray as xr
 import gcpy.constants as gcon
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from PyPDF2 import PdfFileWriter, PdfFileReader
 
+# Matches log file lines where GEOS-Chem or HEMCO opens or reads a file,
+# and captures the last whitespace-delimited token (i.e. the file path)
+_OPEN_OR_READ = re.compile(
+    rb": (?:OPENING|READING)[^\n]*[ \t](\S+)[ \t\r]*$",
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Cache of directory listings, used by get_dir_listing
+_DIR_LISTINGS = {}
+
+
 def convert_lon(data, dim='lon', format='atlantic', neg_dateline=True):
     """ Convert longitudes from -180..180 to 0..360, or vice-versa.
 
@@ -607,7 +622,7 @@ def get_diff_of_diffs(ref, dev):
         with xr.set_options(keep_attrs=True):
             absdiffs = dev - ref
             fracdiffs = dev / ref
-            for v in dev.data_vars.keys():
+            for v in dev.data_vars:
             # Ensure the diffs Dataset includes attributes
                 absdiffs[v].attrs = dev[v].attrs
                 fracdiffs[v].attrs = dev[v].attrs
@@ -617,7 +632,7 @@ def get_diff_of_diffs(ref, dev):
     # since they changed in MAPL v1.0.0.
         if "lat" in ref.dims and "Xdim" in dev.dims:
             ref_newdimnames = dev.copy()
-            for v in dev.data_vars.keys():
+            for v in dev.data_vars:
                 if "Xdim" in dev[v].dims:
                     ref_newdimnames[v].values = ref[v].values.reshape(
                         dev[v].values.shape)
@@ -628,7 +643,7 @@ def get_diff_of_diffs(ref, dev):
         with xr.set_options(keep_attrs=True):
             absdiffs = dev.copy()
             fracdiffs = dev.copy()
-            for v in dev.data_vars.keys():
+            for v in dev.data_vars:
                 if "Xdim" in dev[v].dims or "lat" in dev[v].dims:
                     absdiffs[v] = dev[v] - ref[v]
                     fracdiffs[v] = dev[v] / ref[v]
@@ -700,16 +715,19 @@ def rename_and_flip_gchp_rst_vars(ds):
             SpeciesRst_{species}, Met_BXHEIGHT, Met_DELPDRY, and Met_TropLev,
             with level convention up (level 0 is surface).
     '''
-    for v in ds.data_vars.keys():
+    # Collect all of the new names, then rename with a single call
+    met_names = {'DELP_DRY': 'Met_DELPDRY',
+                 'BXHEIGHT': 'Met_BXHEIGHT',
+                 'TropLev': 'Met_TropLev'}
+    old_to_new = {}
+    for v in ds.data_vars:
         if v.startswith('SPC_'):
             spc = v.replace('SPC_','')
-            ds = ds.rename({v: 'SpeciesRst_'+spc})
-        elif v == 'DELP_DRY':
-            ds = ds.rename({"DELP_DRY": "Met_DELPDRY"})
-        elif v == 'BXHEIGHT':
-            ds = ds.rename({"BXHEIGHT": "Met_BXHEIGHT"})
-        elif v == 'TropLev':
-            ds = ds.rename({"TropLev": "Met_TropLev"})
+            old_to_new[v] = 'SpeciesRst_'+spc
+        elif v in met_names:
+            old_to_new[v] = met_names[v]
+    if old_to_new:
+        ds = ds.rename(old_to_new)
     ds = ds.sortby('lev', ascending=False)
     return ds
 
@@ -778,70 +796,53 @@ def compare_varnames(refdata, devdata, refonly=[], devonly=[], quiet=False):
             devonly          List of 2D or 3D variables that are only
                              present in devdata
     """
-    refvars = [k for k in refdata.data_vars.keys()]
-    devvars = [k for k in devdata.data_vars.keys()]
-    commonvars = sorted(list(set(refvars).intersection(set(devvars))))
-    refonly = [v for v in refvars if v not in devvars]
-    devonly = [v for v in devvars if v not in refvars]
-    dimmismatch = [v for v in commonvars if refdata[v].ndim != devdata[v].ndim]
-    commonvarsOther = [
-        v
-        for v in commonvars
-        if (
-            ("lat" not in refdata[v].dims or "Xdim" not in refdata[v].dims)
-            and ("lon" not in refdata[v].dims or "Ydim" not in refdata[v].dims)
-            and ("lev" not in refdata[v].dims)
-        )
-    ]
-    commonvars2D = [
-        v
-        for v in commonvars
-        if (
-            ("lat" in refdata[v].dims or "Xdim" in refdata[v].dims)
-            and ("lon" in refdata[v].dims or "Ydim" in refdata[v].dims)
-            and ("lev" not in refdata[v].dims)
-        )
-    ]
-    commonvars3D = [
-        v
-        for v in commonvars
-        if (
-            ("lat" in refdata[v].dims or "Xdim" in refdata[v].dims)
-            and ("lon" in refdata[v].dims or "Ydim" in refdata[v].dims)
-            and ("lev" in refdata[v].dims)
-        )
-    ]
+    refvars = set(refdata.data_vars)
+    devvars = set(devdata.data_vars)
+    commonvars = sorted(refvars & devvars)
+    refonly = [v for v in refdata.data_vars if v not in devvars]
+    devonly = [v for v in devdata.data_vars if v not in refvars]
+
+    # Sort the common variables by their dimensions in a single pass
+    dimmismatch = []
+    buckets = {"Other": [], "2D": [], "3D": []}
+    for v in commonvars:
+        refdims = refdata[v].dims
+        if len(refdims) != devdata[v].ndim:
+            dimmismatch.append(v)
+        buckets[get_dims_category(refdims)].append(v)
+    commonvarsOther = buckets["Other"]
+    commonvars2D = buckets["2D"]
+    commonvars3D = buckets["3D"]
 
     # Print information on common and mismatching variables,
     # as well as dimensions
     if quiet == False:
         print("\nComparing variable names in compare_varnames")
-        print("{} common variables".format(len(commonvars)))
+        print(f"{len(commonvars)} common variables")
         if len(refonly) > 0:
-            print("{} variables in ref only (skip)".format(len(refonly)))
-            print("   Variable names: {}".format(refonly))
+            print(f"{len(refonly)} variables in ref only (skip)")
+            print(f"   Variable names: {refonly}")
         else:
             print("0 variables in ref only")
             if len(devonly) > 0:
-                print("{} variables in dev only (skip)".format(len(devonly)))
-                print("   Variable names: {}".format(devonly))
+                print(f"{len(devonly)} variables in dev only (skip)")
+                print(f"   Variable names: {devonly}")
             else:
                 print("0 variables in dev only")
                 if len(dimmismatch) > 0:
-                    print(
-                        "{} common variables have different dimensions".format(
-                            len(dimmismatch)
-                        )
-                    )
-                    print("   Variable names: {}".format(dimmismatch))
+                    print(f"{len(dimmismatch)} common variables "
+                          "have different dimensions")
+                    print(f"   Variable names: {dimmismatch}")
                 else:
                     print("All variables have same dimensions in ref and dev")
 
     # For safety's sake, remove the 0-D and 1-D variables from
     # refonly and devonly.  This will ensure that refonly and
     # devonly will only contain variables that can be plotted.
-    refonly = [v for v in refonly if v not in commonvarsOther]
-    devonly = [v for v in devonly if v not in commonvarsOther]
+    refonly = [v for v in refonly
+               if get_dims_category(refdata[v].dims) != "Other"]
+    devonly = [v for v in devonly
+               if get_dims_category(devdata[v].dims) != "Other"]
 
     return {
         "commonvars": commonvars,
@@ -853,6 +854,27 @@ def compare_varnames(refdata, devdata, refonly=[], devonly=[], quiet=False):
     }
 
 
+def get_dims_category(dims):
+    """
+    Classifies a variable by its dimensions, as done in compare_varnames.
+    Args:
+    -----
+        dims : tuple of str
+            Dimension names of the variable.
+    Returns:
+    --------
+        category : str
+            "3D" for variables with horizontal and level dimensions,
+            "2D" for variables with horizontal but no level dimensions,
+            and "Other" for all other variables (e.g. index variables).
+    """
+    if ("lat" in dims or "Xdim" in dims) and ("lon" in dims or "Ydim" in dims):
+        if "lev" in dims:
+            return "3D"
+        return "2D"
+    return "Other"
+
+
 def compare_stats(refdata, refstr, devdata, devstr, varname):
     """
     Prints out global statistics (array sizes, mean, min, max, sum)
@@ -875,42 +897,362 @@ def compare_stats(refdata, refstr, devdata, devstr, varname):
 
     refvar = refdata[varname]
     devvar = devdata[varname]
-    units = refdata[varname].units
+    [ref_stats, dev_stats] = get_global_stats_of_list([refvar, devvar])
+    print_stats(refstr, refvar, ref_stats, devstr, devvar, dev_stats)
+
+
+def compare_stats_all(refdata, refstr, devdata, devstr, varnames):
+    """
+    Prints out global statistics (array sizes, mean, min, max, sum)
+    for several variables from two xarray Dataset objects.  The
+    statistics of all variables are computed together, so that
+    Dask-backed data are read in a single pass.
+    Args:
+    ----
+        refdata : xarray Dataset
+            The first Dataset to be compared.
+            (This is often referred to as the "Reference" Dataset.)
+        refstr : str
+            Label for refdata to be used in the printout
+        devdata : xarray Dataset
+            The second Dataset to be compared.
+            (This is often referred to as the "Development" Dataset.)
+        devstr : str
+            Label for devdata to be used in the printout
+        varnames : list of str
+            Variable names for which global statistics will be printed out.
+    Returns:
+    --------
+        stats : dict
+            stats[varname]["ref"] and stats[varname]["dev"] contain
+            the global statistics (see get_global_stats) of each
+            variable in refdata and devdata.
+    """
+
+    refvars = [refdata[v] for v in varnames]
+    devvars = [devdata[v] for v in varnames]
+    all_stats = get_global_stats_of_list(refvars + devvars)
+    stats = {}
+    for i, v in enumerate(varnames):
+        ref_stats = all_stats[i]
+        dev_stats = all_stats[i + len(varnames)]
+        print(f"Variable: {v}")
+        print_stats(refstr, refvars[i], ref_stats,
+                    devstr, devvars[i], dev_stats)
+        stats[v] = {"ref": ref_stats, "dev": dev_stats}
+    return stats
+
+
+def print_stats(refstr, refvar, ref_stats, devstr, devvar, dev_stats):
+    """
+    Prints the global statistics of a variable in Ref and Dev.
+    This is an internal routine, which is meant to be called from
+    compare_stats and compare_stats_all.
+    """
+    units = refvar.attrs.get("units", "")
     print("Data units:")
-    print("    {}:  {}".format(refstr, units))
-    print("    {}:  {}".format(devstr, units))
+    print(f"    {refstr}:  {units}")
+    print(f"    {devstr}:  {units}")
     print("Array sizes:")
-    print("    {}:  {}".format(refstr, refvar.shape))
-    print("    {}:  {}".format(devstr, devvar.shape))
+    print(f"    {refstr}:  {refvar.shape}")
+    print(f"    {devstr}:  {devvar.shape}")
     print("Global stats:")
     print("  Mean:")
-    print("    {}:  {}".format(refstr, np.round(refvar.values.mean(), 20)))
-    print("    {}:  {}".format(devstr, np.round(devvar.values.mean(), 20)))
+    print(f"    {refstr}:  {ref_stats['mean']}")
+    print(f"    {devstr}:  {dev_stats['mean']}")
     print("  Min:")
-    print("    {}:  {}".format(refstr, np.round(refvar.values.min(), 20)))
-    print("    {}:  {}".format(devstr, np.round(devvar.values.min(), 20)))
+    print(f"    {refstr}:  {ref_stats['min']}")
+    print(f"    {devstr}:  {dev_stats['min']}")
     print("  Max:")
-    print("    {}:  {}".format(refstr, np.round(refvar.values.max(), 20)))
-    print("    {}:  {}".format(devstr, np.round(devvar.values.max(), 20)))
+    print(f"    {refstr}:  {ref_stats['max']}")
+    print(f"    {devstr}:  {dev_stats['max']}")
     print("  Sum:")
-    print("    {}:  {}".format(refstr, np.round(refvar.values.sum(), 20)))
-    print("    {}:  {}".format(devstr, np.round(devvar.values.sum(), 20)))
+    print(f"    {refstr}:  {ref_stats['sum']}")
+    print(f"    {devstr}:  {dev_stats['sum']}")
+
+
+def get_global_stats(dr):
+    """
+    Computes the global mean, min, max, and sum of an xarray
+    DataArray object.  The reductions are computed together, so that
+    Dask-backed data are read (chunk by chunk) only once, and the
+    mean is derived from the sum.
+
+    Args:
+    -----
+        dr : xarray DataArray
+            The data for which global statistics will be computed.
+
+    Returns:
+    --------
+        stats : dict
+            Contains the global statistics under the keys
+            "mean", "min", "max", and "sum".
+    """
+    return get_global_stats_of_list([dr])[0]
+
+
+def get_global_stats_of_list(darrays):
+    """
+    Computes the global mean, min, max, and sum of several xarray
+    DataArray objects with a single computation.
+
+    Args:
+    -----
+        darrays : list of xarray DataArray
+            The data for which global statistics will be computed.
+
+    Returns:
+    --------
+        stats_list : list of dict
+            The global statistics of each DataArray (in the same
+            order as darrays).  See get_global_stats.
+    """
+
+    # Gather all reductions into one Dataset, so that they share one
+    # task graph.  Use the bare variables, since the coordinates of
+    # the DataArrays may conflict.
+    # NOTE: skipna=False so that NaNs propagate as they do in numpy
+    reductions = {}
+    for i, dr in enumerate(darrays):
+        reductions["min{}".format(i)] = dr.min(skipna=False).variable
+        reductions["max{}".format(i)] = dr.max(skipna=False).variable
+        reductions["sum{}".format(i)] = dr.sum(skipna=False).variable
+    reductions = xr.Dataset(reductions).compute()
+
+    stats_list = []
+    for i, dr in enumerate(darrays):
+        stats = {key: reductions[key + str(i)].values[()]
+                 for key in ["min", "max", "sum"]}
+        stats["mean"] = stats["sum"] / dr.size
+        stats_list.append(stats)
+    return stats_list
+
+
+def prefetch_for_compare(ds, varlist):
+    """
+    Selects variables from a Dataset and starts reading their data,
+    so that reading overlaps with other work that is done before the
+    data are compared (e.g. with compare_stats).
+
+    Args:
+    -----
+        ds : xarray Dataset
+            Dataset containing the variables to be compared.
+        varlist : list of str
+            Names of the variables to be compared.
+
+    Returns:
+    --------
+        ds_subset : xarray Dataset
+            Dataset containing only the variables in varlist.
+
+    Remarks:
+    --------
+        This only has an effect if the data are Dask-backed (e.g.
+        if ds was opened with xr.open_mfdataset, or with chunks=).
+        With a dask.distributed Client, the data are read in the
+        background, and this function returns right away.  With
+        the default scheduler, it returns once all data are read.
+    """
+    return ds[varlist].persist()
 
 
-def get_collection_data(datadir, collection, day, time):
+def get_dir_listing(datadir, refresh=False):
+    """
+    Returns the names of the files in a directory.  The directory
+    is only read once (with a single os.listdir call), and the
+    result is cached for subsequent calls.  This avoids issuing a
+    stat() call for every file on slow shared filesystems.
+
+    Args:
+    -----
+        datadir : str
+            Path to the directory.
+
+    Keyword Args (optional):
+    ------------------------
+        refresh : bool
+            Set this to True to read the directory again (e.g. if
+            files have been added since the last call).
+            Default value: False
+
+    Returns:
+    --------
+        listing : frozenset of str
+            Names of the files in datadir (empty if datadir does
+            not exist).
+    """
+    if refresh or datadir not in _DIR_LISTINGS:
+        try:
+            _DIR_LISTINGS[datadir] = frozenset(os.listdir(datadir))
+        except FileNotFoundError:
+            return frozenset()
+    return _DIR_LISTINGS[datadir]
+
+
+def get_collection_data(datadir, collection, day, time,
+                        chunks=None, engine=None):
+    """
+    Reads a GEOS-Chem Classic diagnostic collection file into an
+    xarray Dataset object.
+
+    Args:
+    -----
+        datadir : str
+            Directory containing the GEOS-Chem output files.
+        collection : str
+            Name of the diagnostic collection (e.g. "SpeciesConc").
+        day, time : str
+            Date (YYYYMMDD) and time (hhmm) in the file name.
+
+    Keyword Args (optional):
+    ------------------------
+        chunks : int, dict, or str
+            Passed to xarray.open_dataset.  Set this (e.g. to
+            {"time": 1}) to read the data lazily in Dask chunks,
+            so that only the chunks that are used are read.
+            Default value: None (read data into numpy arrays)
+        engine : str
+            Passed to xarray.open_dataset (e.g. "netcdf4" or
+            "h5netcdf").
+            Default value: None (let xarray pick the engine)
+
+    Returns:
+    --------
+        data_ds : xarray Dataset
+            Data from the collection file.
+    """
+    # Look for the file in the cached directory listing, and only
+    # read the directory again if the file is not found there
     datafile = get_gcc_filepath(datadir, collection, day, time)
-    if not os.path.exists(datafile):
+    filename = os.path.basename(datafile)
+    if filename not in get_dir_listing(datadir) and \
+       filename not in get_dir_listing(datadir, refresh=True):
         print("ERROR! File does not exist: {}".format(datafile))
-    data_ds = xr.open_dataset(datafile)
+    data_ds = xr.open_dataset(datafile, chunks=chunks, engine=engine)
     return data_ds
 
 
-def get_gchp_collection_data(datadir, collection, day, time):
+def get_gchp_collection_data(datadir, collection, day, time,
+                             chunks=None, engine=None):
+    """
+    Reads a GCHP diagnostic collection file into an xarray Dataset
+    object.  See get_collection_data for a description of the
+    arguments.
+    """
     datafile = get_gchp_filepath(datadir, collection, day, time)
-    data_ds = xr.open_dataset(datafile)
+    data_ds = xr.open_dataset(datafile, chunks=chunks, engine=engine)
     return data_ds
 
 
+# Special bpch variable names that overwrite those created by
+# convert_bpch_names_to_netcdf_names
+_BPCH_SPECIAL_VARS = {
+    "Met_AIRNUMDE": "Met_AIRNUMDEN",
+    "Met_UWND": "Met_U",
+    "Met_VWND": "Met_V",
+    "Met_CLDTOP": "Met_CLDTOPS",
+    "Met_GWET": "Met_GWETTOP",
+    "Met_PRECON": "Met_PRECCON",
+    "Met_PREACC": "Met_PRECTOT",
+    "Met_PBL": "Met_PBLH",
+}
+
+# Tags for the UVFlux* diagnostics
+_UVFLUX_TAGS = [
+    "187nm",
+    "191nm",
+    "193nm",
+    "196nm",
+    "202nm",
+    "208nm",
+    "211nm",
+    "214nm",
+    "261nm",
+    "267nm",
+    "277nm",
+    "295nm",
+    "303nm",
+    "310nm",
+    "316nm",
+    "333nm",
+    "380nm",
+    "574nm",
+]
+
+# Rules that create the netCDF name from the netCDF id (newid) and the
+# last part of the bpch name (suf), for bpch ids with the append action
+_BPCH_APPEND_RULES = dict.fromkeys(
+    [
+        "IJ_AVG_S_",
+        "RN_DECAY_",
+        "WETDCV_S_",
+        "WETDLS_S_",
+        "BXHGHT_S_",
+        "DAO_3D_S_",
+        "DAO_FLDS_",
+        "PL_SUL_",
+        "CV_FLX_S_",
+        "EW_FLX_S_",
+        "NS_FLX_S_",
+        "UP_FLX_S_",
+        "MC_FRC_S_",
+    ],
+    lambda newid, suf: newid + "_" + suf
+)
+_BPCH_APPEND_RULES.update({
+
+    # Special handling for J-values: The bpch variable names all
+    # begin with "J" (e.g. JNO, JACET), so we need to strip the first
+    # character of the variable name manually (bmy, 4/8/19)
+    "JV_MAP_S_": lambda newid, suf: newid + "_" + suf[1:],
+
+    "IJ_SOA_S_": lambda newid, suf: newid + suf,
+    "DRYD_FLX_": lambda newid, suf: newid + "_" + suf[:-2],
+    "DRYD_VEL_": lambda newid, suf: newid + "_" + suf[:-2],
+    "BIOBSRCE_": lambda newid, suf: "Emis" + suf + "_" + newid,
+    "BIOFSRCE_": lambda newid, suf: "Emis" + suf + "_" + newid,
+    "BIOGSRCE_": lambda newid, suf: "Emis" + suf + "_" + newid,
+    "ANTHSRCE_": lambda newid, suf: "Emis" + suf + "_" + newid,
+
+    # Special handling for UV radiative flux diagnostics:
+    # We need to append the bin descriptor to the new name.
+    "FJX_FLXS_DIFWL": lambda newid, suf: \
+        newid + "_" + _UVFLUX_TAGS[int(suf[-2:]) - 1],
+    "FJX_FLXS_DIRWL": lambda newid, suf: \
+        newid + "_" + _UVFLUX_TAGS[int(suf[-2:]) - 1],
+    "FJX_FLXS_NETWL": lambda newid, suf: \
+        newid + "_" + _UVFLUX_TAGS[int(suf[-2:]) - 1],
+})
+
+
+@lru_cache(maxsize=1)
+def get_bpch_to_nc_names():
+    """
+    Reads the table of bpch diagnostic names and the corresponding
+    GEOS-Chem netCDF names from bpch_to_nc_names.yml.  The file is
+    only read on the first call, and the result is cached.
+
+    Returns:
+    --------
+        names : dict
+            Key = bpch id, value[0] = netCDF id, value[1] = action
+            to create the full name using the id.
+        key_lengths : list of int
+            Lengths of the bpch ids, longest first, so that each
+            variable name can be matched to the longest bpch id
+            that it starts with.
+    """
+    # Now read from YAML file (bmy, 4/5/19)
+    bpch_to_nc_names = "bpch_to_nc_names.yml"
+    yamlfile = os.path.join(os.path.dirname(__file__), bpch_to_nc_names)
+    with open(yamlfile, "r") as f:
+        names = yaml.load(f, Loader=yaml.FullLoader)
+    key_lengths = sorted({len(key) for key in names}, reverse=True)
+    return names, key_lengths
+
+
 def convert_bpch_names_to_netcdf_names(ds, verbose=False):
 
     """
@@ -937,51 +1279,15 @@ def convert_bpch_names_to_netcdf_names(ds, verbose=False):
     """
 
     # Names dictionary (key = bpch id, value[0] = netcdf id,
-    # value[1] = action to create full name using id)
-    # Now read from YAML file (bmy, 4/5/19)
-    bpch_to_nc_names = "bpch_to_nc_names.yml"
-    yamlfile = os.path.join(os.path.dirname(__file__), bpch_to_nc_names)
-    names = yaml.load(open(yamlfile))
-
-    # define some special variable to overwrite above
-    special_vars = {
-        "Met_AIRNUMDE": "Met_AIRNUMDEN",
-        "Met_UWND": "Met_U",
-        "Met_VWND": "Met_V",
-        "Met_CLDTOP": "Met_CLDTOPS",
-        "Met_GWET": "Met_GWETTOP",
-        "Met_PRECON": "Met_PRECCON",
-        "Met_PREACC": "Met_PRECTOT",
-        "Met_PBL": "Met_PBLH",
-    }
-
-    # Tags for the UVFlux* diagnostics
-    uvflux_tags = [
-        "187nm",
-        "191nm",
-        "193nm",
-        "196nm",
-        "202nm",
-        "208nm",
-        "211nm",
-        "214nm",
-        "261nm",
-        "267nm",
-        "277nm",
-        "295nm",
-        "303nm",
-        "310nm",
-        "316nm",
-        "333nm",
-        "380nm",
-        "574nm",
-    ]
+    # value[1] = action to create full name using id), and
+    # the lengths of the bpch ids (longest first)
+    names, key_lengths = get_bpch_to_nc_names()
 
     # Python dictionary for variable name replacement
     old_to_new = {}
 
     # Loop over all variable names in the data set
-    for variable_name in ds.data_vars.keys():
+    for variable_name in ds.data_vars:
 
         # Save the original variable name, since this is the name
         # that we actually need to replace in the dataset.
@@ -997,8 +1303,9 @@ def convert_bpch_names_to_netcdf_names(ds, verbose=False):
         oldid = ""
         newid = ""
         idaction = ""
-        for key in names:
-            if key in variable_name:
+        for length in key_lengths:
+            key = variable_name[:length]
+            if key in names:
                 if names[key][1] == "skip":
                     # Verbose output
                     if verbose:
@@ -1024,73 +1331,19 @@ def convert_bpch_names_to_netcdf_names(ds, verbose=False):
 
         # For all the rest:
         else:
-            linearr = variable_name.split("_")
-            varstr = linearr[-1]
-            oldvar = oldid + varstr
-
-            # These categories use append
-            if oldid in [
-                "IJ_AVG_S_",
-                "RN_DECAY_",
-                "WETDCV_S_",
-                "WETDLS_S_",
-                "BXHGHT_S_",
-                "DAO_3D_S_",
-                "PL_SUL_",
-                "CV_FLX_S_",
-                "EW_FLX_S_",
-                "NS_FLX_S_",
-                "UP_FLX_S_",
-                "MC_FRC_S_",
-            ]:
-                newvar = newid + "_" + varstr
-
-            # DAO_FLDS
-            # Skip certain fields that will cause conflicts w/ netCDF
-            elif oldid in "DAO_FLDS_":
-                if oldid in ["DAO_FLDS_PS_PBL", "DAO_FLDS_TROPPRAW"]:
-
-                    # Verbose output
-                    if verbose:
-                        print("Skipping: {}".format(oldid))
-                else:
-                    newvar = newid + "_" + varstr
-
-            # Special handling for J-values: The bpch variable names all
-            # begin with "J" (e.g. JNO, JACET), so we need to strip the first
-            # character of the variable name manually (bmy, 4/8/19)
-            elif oldid == "JV_MAP_S_":
-                newvar = newid + "_" + varstr[1:]
-
-            # IJ_SOA_S_
-            elif oldid == "IJ_SOA_S_":
-                newvar = newid + varstr
-
-            # DRYD_FLX_, DRYD_VEL_
-            elif "DRYD_" in oldid:
-                newvar = newid + "_" + varstr[:-2]
-
-            # BIOBSRCE_, BIOFSRCE_, BIOGSRCE_. ANTHSRCE_
-            elif oldid in ["BIOBSRCE_", "BIOFSRCE_", "BIOGSRCE_", "ANTHSRCE_"]:
-                newvar = "Emis" + varstr + "_" + newid
-
-            # Special handling for UV radiative flux diagnostics:
-            # We need to append the bin descriptor to the new name.
-            elif "FJX_FLXS" in oldid:
-                uvind = int(original_variable_name[-2:]) - 1
-                newvar = newid + "_" + uvflux_tags[uvind]
-
-            # If nothing found...
-            else:
+            # Create the new name with the rule for this category
+            if oldid not in _BPCH_APPEND_RULES:
 
                 # Verbose output
                 if verbose:
                     print("WARNING: Nothing defined for: {}".format(variable_name))
                 continue
+            varstr = variable_name.rpartition("_")[2]
+            newvar = _BPCH_APPEND_RULES[oldid](newid, varstr)
 
             # Overwrite certain variable names
-            if newvar in special_vars:
-                newvar = special_vars[newvar]
+            if newvar in _BPCH_SPECIAL_VARS:
+                newvar = _BPCH_SPECIAL_VARS[newvar]
 
             # Update the dictionary of names with this pair
             old_to_new.update({original_variable_name: newvar})
@@ -1102,10 +1355,12 @@ def convert_bpch_names_to_netcdf_names(ds, verbose=False):
             print("{} ==> {}".format(key.ljust(25), old_to_new[key].ljust(40)))
 
     # Rename the variables in the dataset
-    if verbose:
-        print("\nRenaming variables in the data...")
-    with xr.set_options(keep_attrs=True):
-        ds = ds.rename(name_dict=old_to_new)
+    # (skip if there is nothing to rename, e.g. for netCDF data)
+    if old_to_new:
+        if verbose:
+            print("\nRenaming variables in the data...")
+        with xr.set_options(keep_attrs=True):
+            ds = ds.rename(old_to_new)
 
     # Return the dataset
     return ds
@@ -1194,8 +1449,10 @@ def add_lumped_species_to_dataset(
             dummy_darr = ds[var]
             break
 
-    # Create a new dataset equivalent to the old
-    ds_new = ds
+    # Create a new dataset equivalent to the old.  This is a shallow
+    # copy, so adding variables to it does not change ds, but the
+    # data of the existing variables is not copied.
+    ds_new = ds.copy()
 
     for lspc in lspc_dict:
 
@@ -1204,7 +1461,7 @@ def add_lumped_species_to_dataset(
 
         # Check if overlap with existing species
         if varname_new in ds_new.data_vars and overwrite:
-            ds_new.drop(varname_new)
+            ds_new = ds_new.drop_vars(varname_new)
         else:
             assert(varname_new not in ds_new.data_vars), \
                 "{} already in dataset. To overwrite pass overwrite=True.".\
@@ -1214,12 +1471,10 @@ def add_lumped_species_to_dataset(
         if verbose:
             print("Creating {}".format(varname_new))
 
-        # Initialize new dataarray
-        darr = dummy_darr
-        darr.name = varname_new
-        darr.values = np.full(darr.shape, 0.0)
-
-        # Loop over and sum constituent species values
+        # Sum constituent species values into a new array.  Accumulate
+        # in place so that no intermediate arrays are kept around, and
+        # so that the dummy array (which is part of ds) is not modified.
+        data = np.zeros(dummy_darr.shape)
         num_spc = 0
         for i, spc in enumerate(lspc_dict[lspc]):
             varname = prefix + spc
@@ -1230,17 +1485,20 @@ def add_lumped_species_to_dataset(
             if verbose:
                 print(" -> adding {} with scale {}".\
                       format(spc, lspc_dict[lspc][spc]))
-            darr.values = darr.values + \
-                          ds_new[varname].values * lspc_dict[lspc][spc]
+            data += ds_new[varname].values * lspc_dict[lspc][spc]
             num_spc = num_spc + 1
 
         # Replace values with NaN is no species found in dataset
         if num_spc == 0:
             print('No constituent species found in file. Setting to NaN.')
-            darr.values = np.full(darr.shape, np.nan)
+            data.fill(np.nan)
+
+        # Create the new dataarray with the dummy array's metadata
+        darr = dummy_darr.copy(data=data).rename(varname_new)
 
-        # Merge new variable into dataset
-        ds_new = xr.merge([ds_new, darr])
+        # Add new variable to dataset (this is much cheaper than
+        # xr.merge, which aligns all of the variables in the dataset)
+        ds_new[varname_new] = darr
 
     return ds_new
 
@@ -1405,9 +1663,9 @@ def get_area_from_dataset(ds):
             The surface area in m2, as found in ds.
     """
 
-    if "Met_AREAM2" in ds.data_vars.keys():
+    if "Met_AREAM2" in ds.data_vars:
         return ds["Met_AREAM2"]
-    elif "AREA" in ds.data_vars.keys():
+    elif "AREA" in ds.data_vars:
         return ds["AREA"]
     else:
         msg = (
@@ -1441,7 +1699,7 @@ def get_variables_from_dataset(ds, varlist):
 
     ds_subset = xr.Dataset()
     for v in varlist:
-        if v in ds.data_vars.keys():
+        if v in ds.data_vars:
             ds_subset = xr.merge([ds_subset, ds[v]])
         else:
             msg = "{} was not found in this dataset!".format(v)
@@ -1700,8 +1958,9 @@ def extract_pathnames_from_log(filename, prefix_filter=""):
     downloaded from gcgrid or from Amazon S3.
     Args:
     -----
-        filename : str
-            GEOS-Chem standard log file
+        filename : str or list of str
+            GEOS-Chem standard log file(s).  If several log files
+            are passed, they are scanned in parallel processes.
         prefix_filter : str
             Restricts the output to file paths starting with
             this prefix (e.g. "/home/ubuntu/ExtData/HEMCO/")
@@ -1710,40 +1969,63 @@ def extract_pathnames_from_log(filename, prefix_filter=""):
     --------
         data list : list of str
             List of full pathnames of data files found in
-            the log file.
+            the log file(s).
     Author:
     -------
         Jiawei Zhuang (jiaweizhuang@g.harvard.edu)
     """
 
+    # Scanning the logs is CPU-bound, so use processes instead of
+    # threads when there is more than one log file to read
+    if isinstance(filename, str):
+        data_list = _get_pathnames_from_one_log(filename, prefix_filter)
+    elif len(filename) == 0:
+        data_list = set()
+    elif len(filename) == 1:
+        data_list = _get_pathnames_from_one_log(filename[0], prefix_filter)
+    else:
+        data_list = set()  # only keep unique files
+        max_workers = min(len(filename), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for paths in executor.map(_get_pathnames_from_one_log,
+                                      filename,
+                                      [prefix_filter] * len(filename)):
+                data_list.update(paths)
+
+    # Return a sorted list of unique file paths
+    data_list = sorted(list(data_list))
+    return data_list
+
+
+def _get_pathnames_from_one_log(filename, prefix_filter=""):
+    """
+    Returns the set of unique pathnames found in a single GEOS-Chem
+    log file.  Called by extract_pathnames_from_log.
+    """
+
     # Initialization
     prefix_len = len(prefix_filter)
     data_list = set()  # only keep unique files
 
-    # Open file (or die with error)
+    # Scan the memory-mapped file with a single regular expression
+    # search (or die with error).  This avoids creating a Python
+    # string for every line; only the matching paths are decoded.
+    # Add file paths to the data_list set.
     try:
-        f = open(filename, "r")
+        with open(filename, "rb") as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for match in _OPEN_OR_READ.finditer(mm):
+                        # normalize so that e.g. "a//b" and "a/./b"
+                        # are counted as the same file
+                        data_path = os.path.normpath(match.group(1).decode())
+                        # remove common prefix
+                        if data_path.startswith(prefix_filter):
+                            trimmed_path = data_path[prefix_len:]
+                            data_list.add(trimmed_path)
     except FileNotFoundError:
         raise FileNotFoundError("Could not find file {}".format(filename))
 
-    # Read data from the file line by line.
-    # Add file paths to the data_list set.
-    line = f.readline()
-    while line:
-        upcaseline = line.upper()
-        if (": OPENING" in upcaseline) or (": READING" in upcaseline):
-            data_path = line.split()[-1]
-            # remove common prefix
-            if data_path.startswith(prefix_filter):
-                trimmed_path = data_path[prefix_len:]
-                data_list.add(trimmed_path)
-
-        # Read next line
-        line = f.readline()
-
-    # Close file and return
-    f.close()
-    data_list = sorted(list(data_list))
     return data_list
 
 def get_gcc_filepath(outputdir, collection, day, time):